@@ -20,11 +20,9 @@ sys.path.insert(0, ROOT_DIR)
 os.environ["RENDERCANVAS_FORCE_OFFSCREEN"] = "true"
 
 
-# Load wglibu so autodoc can query docstrings
+# Load rendercanvas to get the version. Submodules (e.g. the stub backend and
+# the context interface) are imported by autodoc when it needs them.
 import rendercanvas  # noqa: E402
-import rendercanvas.stub  # noqa: E402 - we use the stub backend to generate doccs
-import rendercanvas._context  # noqa: E402 - we use the ContexInterface to generate doccs
-import rendercanvas.utils.bitmappresentadapter  # noqa: E402
 
 # -- Project information -----------------------------------------------------
 
@@ -63,6 +61,9 @@ exclude_patterns = ["_build", "Thumbs.db", ".DS_Store"]
 
 master_doc = "index"
 
+# Don't add an entry to the toc for every documented object, it slows down the build a lot.
+toc_object_entries = False
+
 
 # -- Sphinx Gallery -----------------------------------------------------
 
@@ -77,7 +78,7 @@ sphinx_gallery_conf = {
     "doc_module": ("rendercanvas",),
     # "image_scrapers": (),,
     "remove_config_comments": True,
-    "examples_dirs": "../examples/",
+    "examples_dirs": os.path.join(ROOT_DIR, "examples"),
 }
 
 # -- Options for HTML output -------------------------------------------------
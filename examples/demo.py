@@ -33,28 +33,34 @@ draw_frame = setup_drawing_sync(canvas)
 canvas.request_draw(draw_frame)
 
 
+# Event types that occur too often to print
+noisy_event_types = {"pointer_move", "before_draw", "animate"}
+
+
 @canvas.add_event_handler("*")
 async def process_event(event):
-    if event["event_type"] not in ["pointer_move", "before_draw", "animate"]:
+    event_type = event["event_type"]
+    if event_type not in noisy_event_types:
         print(event)
 
-    if event["event_type"] == "key_down":
-        if event["key"] == "Escape":
+    if event_type == "key_down":
+        key = event["key"]
+        if key == "Escape":
             canvas.close()
-        elif event["key"] in " f":
+        elif key in " f":
             # Force draw for 2 secs
             print("force-drawing ...")
-            etime = time.time() + 2
+            etime = time.perf_counter() + 2
             i = 0
-            while time.time() < etime:
+            while time.perf_counter() < etime:
                 i += 1
                 canvas.force_draw()
             print(f"Drew {i} frames in 2s.")
-        elif event["key"] == "s":
+        elif key == "s":
             print("Async sleep ... zzzz")
             await sleep(2)
             print("waking up")
-    elif event["event_type"] == "close":
+    elif event_type == "close":
         # Should see this exactly once, either when pressing escape, or
         # when pressing the window close button.
         print("Close detected!")
@@ -13,6 +13,7 @@ from rendercanvas.auto import RenderCanvas, loop
 
 canvas = RenderCanvas(update_mode="continuous")
 context = canvas.get_context("bitmap")
+rng = np.random.default_rng()
 
 
 @canvas.request_draw
@@ -20,7 +21,7 @@ def animate():
     w, h = canvas.get_logical_size()
     shape = int(h) // 4, int(w) // 4
 
-    bitmap = np.random.uniform(0, 255, shape).astype(np.uint8)
+    bitmap = rng.integers(0, 256, shape, dtype=np.uint8)
     context.set_bitmap(bitmap)
 
 
@@ -55,9 +55,7 @@ class ExampleWidget(QtWidgets.QWidget):
         self.show()
 
     def addLine(self, line):
-        t = self.output.toPlainText()
-        t += "\n" + line
-        self.output.setPlainText(t)
+        self.output.append(line)
 
     def whenButtonClicked(self):
         self.addLine(f"Clicked at {time.time():0.1f}")
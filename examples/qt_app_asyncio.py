@@ -69,9 +69,7 @@ class ExampleWidget(QtWidgets.QWidget):
         self.show()
 
     def addLine(self, line):
-        t = self.output.toPlainText()
-        t += "\n" + line
-        self.output.setPlainText(t)
+        self.output.append(line)
 
     async def whenButtonClicked(self):
         self.addLine("Waiting 1 sec ...")
@@ -5,7 +5,7 @@ Snake game
 Simple snake game based on bitmap rendering. Work in progress.
 """
 
-from collections import deque
+from itertools import cycle
 
 import numpy as np
 
@@ -19,7 +19,10 @@ context = canvas.get_context("bitmap")
 world = np.zeros((120, 160), np.uint8)
 pos = [100, 100]
 direction = [1, 0]
-q = deque()
+
+# Ring buffer with the positions that make up the snake (None while it grows)
+tail = [None] * 20
+tail_indices = cycle(range(len(tail)))
 
 
 @canvas.add_event_handler("key_down")
@@ -41,24 +44,17 @@ def on_key(event):
 
 @canvas.request_draw
 def animate():
-    pos[0] += direction[0]
-    pos[1] += direction[1]
-
-    if pos[0] < 0:
-        pos[0] = world.shape[1] - 1
-    elif pos[0] >= world.shape[1]:
-        pos[0] = 0
-    if pos[1] < 0:
-        pos[1] = world.shape[0] - 1
-    elif pos[1] >= world.shape[0]:
-        pos[1] = 0
-
-    q.append(tuple(pos))
-    world[pos[1], pos[0]] = 255
+    # Move, wrapping around the edges
+    pos[0] = (pos[0] + direction[0]) % world.shape[1]
+    pos[1] = (pos[1] + direction[1]) % world.shape[0]
 
-    while len(q) > 20:
-        old_pos = q.popleft()
-        world[old_pos[1], old_pos[0]] = 0
+    i = next(tail_indices)
+    if tail[i] is not None:
+        old_x, old_y = tail[i]
+        world[old_y, old_x] = 0
+
+    tail[i] = tuple(pos)
+    world[pos[1], pos[0]] = 255
 
     context.set_bitmap(world)
 
@@ -19,9 +19,12 @@ screenshots_dir = examples_dir / "screenshots"
 
 
 def find_examples(query=None, negative_query=None, return_stems=False):
+    # Search the raw bytes, so we don't have to decode each file
+    query = None if query is None else query.encode()
+    negative_query = None if negative_query is None else negative_query.encode()
     result = []
     for example_path in examples_dir.glob("*.py"):
-        example_code = example_path.read_text()
+        example_code = example_path.read_bytes()
         query_match = query is None or query in example_code
         negative_query_match = (
             negative_query is None or negative_query not in example_code
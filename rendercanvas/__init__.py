@@ -4,13 +4,48 @@ RenderCanvas: one canvas API, multiple backends.
 
 # ruff: noqa: F401
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from ._version import __version__, version_info
 from . import _coreutils
-from ._events import EventType
-from .base import BaseRenderCanvas, BaseLoop
+
+if TYPE_CHECKING:
+    # Make the lazy names visible to static analysis
+    from .base import BaseLoop, BaseRenderCanvas
+    from ._events import EventType
 
 __all__ = [
     "BaseLoop",
     "BaseRenderCanvas",
     "EventType",
 ]
+
+# The public classes are imported on first access (PEP 562), so that e.g.
+# getting the version does not import the whole machinery.
+_lazy_names = {
+    "BaseLoop": ".base",
+    "BaseRenderCanvas": ".base",
+    "EventType": "._events",
+}
+
+# Submodules that are available as attributes once .base is imported, like
+# rendercanvas.utils.asyncs. Importing .base makes these work as before.
+_lazy_submodules = ("base", "utils")
+
+
+def __getattr__(name):
+    if name in _lazy_submodules:
+        import_module(".base", __name__)
+        return globals()[name]
+    try:
+        module_name = _lazy_names[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -10,6 +10,9 @@ binaries = []
 # Add modules that are safe to add, i.e. don't pull in dependencies that we don't want.
 hiddenimports += ["asyncio", "rendercanvas.async", "rendercanvas.offscreen"]
 
+# The root namespace imports these lazily, so PyInstaller cannot detect them.
+hiddenimports += ["rendercanvas.base", "rendercanvas._events"]
+
 # Since glfw does not have a hook like this, it does not include the glfw binary
 # when freezing. We can solve this with the code below. Makes the binary a bit
 # larger, but only marginally (less than 300kb).
@@ -9,7 +9,6 @@ import types
 import weakref
 import logging
 import ctypes.util
-from contextlib import contextmanager
 
 
 # %% Logging
@@ -31,19 +30,29 @@ def error_message_hash(message):
     return hash(message)
 
 
-@contextmanager
-def log_exception(kind):
+class ExceptionLogger:
     """Context manager to log any exceptions, but only log a one-liner
     for subsequent occurrences of the same error to avoid spamming by
     repeating errors in e.g. a draw function or event callback.
+
+    Instances hold no state besides the message prefix, so they can be
+    reused (and nested) freely. Use ``log_exception()`` to create one.
     """
-    try:
-        yield
-    except Exception as err:
+
+    __slots__ = ["kind"]
+
+    def __init__(self, kind):
+        self.kind = kind
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, exc_type, err, tb):
+        if err is None or not isinstance(err, Exception):
+            return False
+        kind = self.kind
         # Store exc info for postmortem debugging
-        exc_info = list(sys.exc_info())
-        exc_info[2] = exc_info[2].tb_next  # skip *this* function
-        sys.last_type, sys.last_value, sys.last_traceback = exc_info
+        sys.last_type, sys.last_value, sys.last_traceback = exc_type, err, tb
         # Show traceback, or a one-line summary
         msg = str(err)
         msgh = error_message_hash(msg)
@@ -58,6 +67,12 @@ def log_exception(kind):
             msg = kind + ": " + msg.split("\n")[0].strip()
             msg = msg if len(msg) <= 70 else msg[:69] + "…"
             logger.error(msg + f" ({count})")
+        return True
+
+
+def log_exception(kind):
+    """Get a context manager to log any exceptions, see ``ExceptionLogger``."""
+    return ExceptionLogger(kind)
 
 
 # %% Weak bindings
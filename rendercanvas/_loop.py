@@ -3,13 +3,20 @@ The base loop implementation.
 """
 
 import signal
+from itertools import chain
 from inspect import iscoroutinefunction
 
 from ._coreutils import logger, log_exception
-from .utils.asyncs import sleep
+from .utils.asyncs import sleep, wait_for_event, Event
 from .utils import asyncadapter
 
 
+# Shared context manager for the callbacks of call_soon() and call_later()
+log_callback_error = log_exception("Callback error:")
+
+# The names of the loop states, used in the repr.
+STATE_NAMES = ("off", "ready", "active", "active", "running")
+
 HANDLED_SIGNALS = (
     signal.SIGINT,  # Unix signal 2. Sent by Ctrl+C.
     signal.SIGTERM,  # Unix signal 15. Sent by `kill <pid>`.
@@ -44,8 +51,10 @@ class BaseLoop:
 
     def __init__(self):
         self.__tasks = set()
-        self.__canvas_groups = set()
+        self.__canvas_groups = {}  # id -> group, so we don't depend on __hash__
         self.__should_stop = 0
+        self.__canvas_change = None
+        self.__pending_calls = {}  # coalesce_key -> (callback, args)
         self.__state = (
             0  # 0: off, 1: ready, 2: detected-active, 3: inter-active, 4: running
         )
@@ -53,7 +62,7 @@ class BaseLoop:
     def __repr__(self):
         full_class_name = f"{self.__class__.__module__}.{self.__class__.__name__}"
         state = self.__state
-        state_str = ["off", "ready", "active", "active", "running"][state]
+        state_str = STATE_NAMES[state]
         return f"<{full_class_name} '{state_str}' ({state}) at {hex(id(self))}>"
 
     def _mark_as_interactive(self):
@@ -68,18 +77,30 @@ class BaseLoop:
             self.__state = 1
             self._rc_init()
             self.add_task(self._loop_task, name="loop-task")
-        self.__canvas_groups.add(canvas_group)
+        self.__canvas_groups[id(canvas_group)] = canvas_group
+        self._notify_canvas_change()
 
     def _unregister_canvas_group(self, canvas_group):
         # A CanvasGroup will call this when it selects a different loop.
-        self.__canvas_groups.discard(canvas_group)
+        self.__canvas_groups.pop(id(canvas_group), None)
+        self._notify_canvas_change()
+
+    def _notify_canvas_change(self):
+        """Wake up the loop-task, so it handles e.g. a closed canvas right away."""
+        event = self.__canvas_change
+        if event is not None:
+            event.set()
 
     def get_canvases(self):
         """Get a list of currently active (not-closed) canvases."""
-        canvases = []
-        for canvas_group in self.__canvas_groups:
-            canvases += canvas_group.get_canvases()
-        return canvases
+        # Iterate over a snapshot, because get_canvases() calls into backend
+        # code (get_closed), which may cause a group to be (un)registered.
+        canvas_groups = tuple(self.__canvas_groups.values())
+        return list(
+            chain.from_iterable(
+                canvas_group.get_canvases() for canvas_group in canvas_groups
+            )
+        )
 
     async def _loop_task(self):
         # This task has multiple purposes:
@@ -96,27 +117,25 @@ class BaseLoop:
         # Keep track of event emitter objects
         event_emitters = {id(c): c._events for c in self.get_canvases()}
 
+        # Closing a canvas or stopping the loop sets this event, so we don't
+        # have to wait for the next poll. We still poll, because a canvas can
+        # also be closed by the GUI or the gc, and for _rc_gui_poll().
+        self.__canvas_change = Event()
+        check_soon = False
+
         try:
             while True:
-                await sleep(0.1)
-
-                # Get list of canvases, beware to delete the list when we're done with it!
-                canvases = self.get_canvases()
-
-                # Send close event for closed canvases
-                new_event_emitters = {id(c): c._events for c in canvases}
-                closed_canvas_ids = set(event_emitters) - set(new_event_emitters)
-                for canvas_id in closed_canvas_ids:
-                    events = event_emitters[canvas_id]
-                    await events.close()
-
-                # Keep canvases alive
-                for canvas in canvases:
-                    canvas._rc_gui_poll()
-                    del canvas
-
-                canvas_count = len(canvases)
-                del canvases
+                if check_soon:
+                    # Yield once, so canvases that we just closed can finish closing
+                    check_soon = False
+                    await sleep(0)
+                else:
+                    await wait_for_event(self.__canvas_change, 0.1)
+                # Only replace the event when it was set, not after a plain timeout
+                if self.__canvas_change.is_set():
+                    self.__canvas_change = Event()
+
+                canvas_count = await self.__process_canvases(event_emitters)
 
                 # Should we stop?
 
@@ -130,14 +149,45 @@ class BaseLoop:
                     break
                 elif self.__should_stop:
                     # Close all remaining canvases. Loop will stop in a next iteration.
-                    for canvas in self.get_canvases():
-                        if not getattr(canvas, "_rc_closed_by_loop", False):
-                            canvas._rc_closed_by_loop = True
-                            canvas._rc_close()
-                        del canvas
+                    # If we asked any canvases to close, check again soon (but only once).
+                    check_soon = self.__close_canvases()
 
         finally:
-            self.__stop()
+            # The loop may have been stopped already, e.g. with stop(force=True)
+            if self.__state > 0:
+                self.__stop()
+
+    async def __process_canvases(self, event_emitters):
+        # Process the canvases for one iteration of the loop-task, and return
+        # the number of live canvases. This is a separate function so that
+        # the references to the canvases are dropped when it returns.
+        canvases = self.get_canvases()
+
+        # Send close event for closed canvases
+        new_event_emitters = {id(c): c._events for c in canvases}
+        closed_canvas_ids = set(event_emitters) - set(new_event_emitters)
+        for canvas_id in closed_canvas_ids:
+            events = event_emitters.pop(canvas_id)
+            await events.close()
+
+        # Also track canvases that were created while the loop runs
+        event_emitters.update(new_event_emitters)
+
+        # Keep canvases alive
+        for canvas in canvases:
+            canvas._rc_gui_poll()
+
+        return len(canvases)
+
+    def __close_canvases(self):
+        # Ask the canvases to close, return whether any canvas was asked.
+        closed_any = False
+        for canvas in self.get_canvases():
+            if not getattr(canvas, "_rc_closed_by_loop", False):
+                canvas._rc_closed_by_loop = True
+                canvas._rc_close()
+                closed_any = True
+        return closed_any
 
     def add_task(self, async_func, *args, name="unnamed"):
         """Run an async function in the event-loop.
@@ -154,22 +204,47 @@ class BaseLoop:
 
         self._rc_add_task(wrapper, name)
 
-    def call_soon(self, callback, *args):
+    def call_soon(self, callback, *args, coalesce_key=None):
         """Arrange for a callback to be called as soon as possible.
 
         The callback will be called in the next iteration of the event-loop,
         but other pending events/callbacks may be handled first. Returns None.
+
+        If ``coalesce_key`` is given and a call with the same key is still
+        pending, that call is updated to use the new callback and args, instead
+        of scheduling another call. This avoids work piling up when calls are
+        scheduled faster than the loop can handle them.
         """
         if not callable(callback):
             raise TypeError("call_soon() expects a callable.")
         elif iscoroutinefunction(callback):
             raise TypeError("call_soon() expects a normal callable, not an async one.")
 
-        async def wrapper():
-            with log_exception("Callback error:"):
-                callback(*args)
+        if coalesce_key is None:
 
-        self._rc_add_task(wrapper, "call_soon")
+            def wrapper():
+                with log_callback_error:
+                    callback(*args)
+
+            self._rc_call_soon(wrapper)
+
+        else:
+            pending_calls = self.__pending_calls
+            if coalesce_key in pending_calls:
+                pending_calls[coalesce_key] = callback, args
+                return
+
+            def wrapper():
+                # The call may have been dropped because the loop stopped
+                call = pending_calls.pop(coalesce_key, None)
+                if call is not None:
+                    with log_callback_error:
+                        call[0](*call[1])
+
+            self._rc_call_soon(wrapper)
+            # Store the call only when scheduling succeeded, otherwise the key
+            # would stay behind, and later calls with that key would be dropped.
+            pending_calls[coalesce_key] = callback, args
 
     def call_later(self, delay, callback, *args):
         """Arrange for a callback to be called after the given delay (in seconds)."""
@@ -181,12 +256,11 @@ class BaseLoop:
         elif iscoroutinefunction(callback):
             raise TypeError("call_later() expects a normal callable, not an async one.")
 
-        async def wrapper():
-            with log_exception("Callback error:"):
-                await sleep(delay)
+        def wrapper():
+            with log_callback_error:
                 callback(*args)
 
-        self._rc_add_task(wrapper, "call_later")
+        self._rc_call_later_cb(delay, wrapper)
 
     def run(self):
         """Enter the main loop.
@@ -202,7 +276,7 @@ class BaseLoop:
         if self.__state == 0:
             # Euhm, I guess we can run it one iteration, just make sure our loop-task is running!
             self._register_canvas_group(0)
-            self.__canvas_groups.discard(0)
+            self.__canvas_groups.pop(id(0), None)
         if self.__state == 1:
             # Yes we can
             pass
@@ -239,7 +313,7 @@ class BaseLoop:
         if self.__state == 0:
             # Euhm, I guess we can run it one iteration, just make sure our loop-task is running!
             self._register_canvas_group(0)
-            self.__canvas_groups.discard(0)
+            self.__canvas_groups.pop(id(0), None)
         if self.__state == 1:
             # Yes we can
             pass
@@ -250,37 +324,50 @@ class BaseLoop:
 
         await self._rc_run_async()
 
-    def stop(self):
+    def stop(self, *, force=False):
         """Close all windows and stop the currently running event-loop.
 
         If the loop is active but not running via our ``run()`` method, the loop
         moves back to its off-state, but the underlying loop is not stopped.
+
+        If ``force`` is True, the loop is stopped right away, without closing
+        the canvases first (and without emitting their close events). This
+        has no effect when the loop is not active.
         """
+        if force:
+            # The backends only expect _rc_stop() while the loop is active
+            if self.__state >= 2:
+                self.__stop()
+            return
         # Only take action when we're inside the run() method
         self.__should_stop += 1
         if self.__should_stop >= 4:
             # If for some reason the tick method is no longer being called, but the loop is still running, we can still stop it by spamming stop() :)
             self.__stop()
+        else:
+            self._notify_canvas_change()
 
     def __stop(self):
         """Move to the off-state."""
-        # If we used the async adapter, cancel any tasks
-        while self.__tasks:
-            task = self.__tasks.pop()
-            with log_exception("task cancel:"):
+        # If we used the async adapter, cancel any tasks. The guard is per task,
+        # so one failing cancel() does not prevent cancelling the others.
+        tasks, self.__tasks = self.__tasks, set()
+        cancel_guard = log_exception("task cancel:")
+        for task in tasks:
+            with cancel_guard:
                 task.cancel()
+        # Drop coalesced calls that did not run yet
+        self.__pending_calls.clear()
         # Turn off
         self.__state = 0
         self.__should_stop = 0
+        self.__canvas_change = None
         self._rc_stop()
 
     def __setup_interrupt(self):
         """Setup the interrupt handlers."""
 
-        def on_interrupt(sig, _frame):
-            logger.warning(f"Received signal {signal.strsignal(sig)}")
-            self.stop()
-
+        on_interrupt = self.__on_interrupt
         prev_handlers = {}
 
         for sig in HANDLED_SIGNALS:
@@ -293,11 +380,15 @@ class BaseLoop:
             else:
                 # Setting the signal can raise ValueError if this is not the main thread/interpreter
                 try:
-                    prev_handlers[sig] = signal.signal(signal.SIGINT, on_interrupt)
+                    prev_handlers[sig] = signal.signal(sig, on_interrupt)
                 except ValueError:
                     break
         return prev_handlers
 
+    def __on_interrupt(self, sig, _frame):
+        logger.warning(f"Received signal {signal.strsignal(sig)}")
+        self.stop()
+
     def _rc_init(self):
         """Put the loop in a ready state.
 
@@ -352,6 +443,39 @@ class BaseLoop:
         self.__tasks.add(task)
         task.add_done_callback(self.__tasks.discard)
 
+    def _rc_call_soon(self, callback):
+        """Method to call a callback as soon as possible.
+
+        This method is optional. The default implementation runs the callback in
+        a task, so that pending callbacks are cancelled when the loop stops.
+
+        * Only schedule the callback natively if it can be cancelled in ``_rc_stop()``.
+        * No need to catch errors from the callback; that's dealt with internally.
+        * Return None.
+        """
+
+        async def wrapper():
+            callback()
+
+        self._rc_add_task(wrapper, "call_soon")
+
+    def _rc_call_later_cb(self, delay, callback):
+        """Method to call a callback after the given delay, used by ``call_later()``.
+
+        This method is optional. The default implementation sleeps in a task, so
+        that pending callbacks are cancelled when the loop stops.
+
+        * Only use a native timer if it can be cancelled in ``_rc_stop()``.
+        * No need to catch errors from the callback; that's dealt with internally.
+        * Return None.
+        """
+
+        async def wrapper():
+            await sleep(delay)
+            callback()
+
+        self._rc_add_task(wrapper, "call_later")
+
     def _rc_call_later(self, delay, callback):
         """Method to call a callback in delay number of seconds.
 
@@ -8,6 +8,7 @@ __all__ = ["AsyncioLoop", "loop"]
 from .base import BaseLoop
 
 import sniffio
+from sniffio import thread_local as sniffio_thread_local
 
 
 class AsyncioLoop(BaseLoop):
@@ -88,6 +89,37 @@ class AsyncioLoop(BaseLoop):
             self.__tasks.add(task)
             task.add_done_callback(self.__tasks.discard)
 
+    def _rc_call_soon(self, callback):
+        loop = self._interactive_loop or self._run_loop
+        if loop is None:
+            super()._rc_call_soon(callback)
+        else:
+            self.__schedule_native(loop.call_soon, callback)
+
+    def _rc_call_later_cb(self, delay, callback):
+        loop = self._interactive_loop or self._run_loop
+        if loop is None:
+            super()._rc_call_later_cb(delay, callback)
+        else:
+            self.__schedule_native(loop.call_later, callback, delay)
+
+    def __schedule_native(self, schedule, callback, *args):
+        # Schedule with the native loop, and keep its handle so _rc_stop() can cancel it.
+        # The callback runs outside a task, so we tell sniffio that this is asyncio.
+        def wrapper():
+            nonlocal handle
+            self.__tasks.discard(handle)
+            handle = None  # break the ref cycle, so the callback can be freed
+            old_name = sniffio_thread_local.name
+            sniffio_thread_local.name = "asyncio"
+            try:
+                callback()
+            finally:
+                sniffio_thread_local.name = old_name
+
+        handle = schedule(*args, wrapper)
+        self.__tasks.add(handle)
+
     def _rc_call_later(self, *args):
         raise NotImplementedError()  # we implement _rc_add_task instead
 
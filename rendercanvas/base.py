@@ -439,6 +439,10 @@ class BaseRenderCanvas:
     def close(self):
         """Close the canvas."""
         self._rc_close()
+        # Let the loop detect the close without waiting for its next poll
+        loop = self._rc_canvas_group and self._rc_canvas_group.get_loop()
+        if loop is not None:
+            loop._notify_canvas_change()
 
     def get_closed(self):
         """Get whether the window is closed."""
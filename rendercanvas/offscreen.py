@@ -5,6 +5,8 @@ Offscreen canvas. No scheduling.
 __all__ = ["OffscreenRenderCanvas", "RenderCanvas", "loop"]
 
 import time
+import heapq
+from itertools import count
 
 from .base import BaseCanvasGroup, BaseRenderCanvas, BaseLoop
 
@@ -111,20 +113,18 @@ class StubLoop(BaseLoop):
 
     def __init__(self):
         super().__init__()
-        self._callbacks = []
+        self._callbacks = []  # priority queue of (time, index, callback)
+        self._counter = count()
 
     def process_tasks(self):
+        # Collect the callbacks that are due, and then call them. Callbacks
+        # that are scheduled by these callbacks are handled in a next call.
+        now = time.perf_counter()
         callbacks_to_run = []
-        new_callbacks = []
-        for etime, callback in self._callbacks:
-            if time.perf_counter() >= etime:
-                callbacks_to_run.append(callback)
-            else:
-                new_callbacks.append((etime, callback))
-        if callbacks_to_run:
-            self._callbacks = new_callbacks
-            for callback in callbacks_to_run:
-                callback()
+        while self._callbacks and self._callbacks[0][0] <= now:
+            callbacks_to_run.append(heapq.heappop(self._callbacks)[2])
+        for callback in callbacks_to_run:
+            callback()
 
     def _rc_run(self):
         self.process_tasks()
@@ -135,8 +135,16 @@ class StubLoop(BaseLoop):
     def _rc_add_task(self, async_func, name):
         super()._rc_add_task(async_func, name)
 
+    def _rc_call_soon(self, callback):
+        # Pending callbacks are dropped in _rc_stop()
+        self._rc_call_later(0, callback)
+
+    def _rc_call_later_cb(self, delay, callback):
+        super()._rc_call_later_cb(delay, callback)
+
     def _rc_call_later(self, delay, callback):
-        self._callbacks.append((time.perf_counter() + delay, callback))
+        etime = time.perf_counter() + delay
+        heapq.heappush(self._callbacks, (etime, next(self._counter), callback))
 
 
 loop = StubLoop()
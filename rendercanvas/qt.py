@@ -202,6 +202,14 @@ class QtLoop(BaseLoop):
         # we use the async adapter with call_later
         return super()._rc_add_task(async_func, name)
 
+    def _rc_call_soon(self, callback):
+        # The native timer cannot be cancelled, so we use the default, which creates a task
+        super()._rc_call_soon(callback)
+
+    def _rc_call_later_cb(self, delay, callback):
+        # The native timer cannot be cancelled, so we use the default, which creates a task
+        super()._rc_call_later_cb(delay, callback)
+
     def _rc_call_later(self, delay, callback):
         delay_ms = int(max(0, delay * 1000))
         QtCore.QTimer.singleShot(delay_ms, callback)
@@ -84,6 +84,14 @@ class RawLoop(BaseLoop):
         # we use the async adapter with call_later
         return super()._rc_add_task(async_func, name)
 
+    def _rc_call_soon(self, callback):
+        # Use the default, which creates a task, so it's cancelled when the loop stops
+        super()._rc_call_soon(callback)
+
+    def _rc_call_later_cb(self, delay, callback):
+        # Use the default, which creates a task, so it's cancelled when the loop stops
+        super()._rc_call_later_cb(delay, callback)
+
     def _rc_call_later(self, delay, callback):
         now = time.perf_counter()
         time_at = now + max(0, delay)
@@ -33,6 +33,12 @@ class StubLoop(BaseLoop):
     def _rc_add_task(self, async_func, name):
         raise NotImplementedError()
 
+    def _rc_call_soon(self, callback):
+        raise NotImplementedError()
+
+    def _rc_call_later_cb(self, delay, callback):
+        raise NotImplementedError()
+
     def _rc_call_later(self, delay, callback):
         raise NotImplementedError()
 
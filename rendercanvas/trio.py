@@ -43,6 +43,13 @@ class TrioLoop(BaseLoop):
         self._send_channel.send_nowait((async_func, name))
         return None
 
+    def _rc_call_soon(self, callback):
+        # Trio has no sync call_soon, so we use the default, which creates a task
+        super()._rc_call_soon(callback)
+
+    def _rc_call_later_cb(self, delay, callback):
+        super()._rc_call_later_cb(delay, callback)
+
     def _rc_call_later(self, delay, callback):
         raise NotImplementedError()  # we implement _rc_add_task() instead
 
@@ -12,13 +12,16 @@ logger = logging.getLogger("asyncadapter")
 
 
 class Sleeper:
+    __slots__ = ["delay"]
+
     def __init__(self, delay):
         self.delay = delay
 
     def __await__(self):
         # This most be a generator, but it is unspecified what must be yielded; this
-        # is framework-specific. So we use our own little protocol.
-        yield {"wait_method": "sleep", "delay": self.delay}
+        # is framework-specific. So we use our own little protocol: we yield the
+        # awaitable itself, and the Task dispatches on its type.
+        yield self
 
 
 async def sleep(delay):
@@ -31,25 +34,52 @@ class Event:
 
     def __init__(self):
         self._is_set = False
-        self._tasks = []
+        self._tasks = {}  # dict to avoid duplicates while preserving order
+
+    def is_set(self):
+        return self._is_set
 
     async def wait(self):
-        if self._is_set:
-            return
-        else:
-            return self  # triggers __await__
+        if not self._is_set:
+            await self
 
     def __await__(self):
-        return {"wait_method": "event", "event": self}
-
-    def _add_task(self, task):
-        self._tasks.append(task)
+        yield self
+
+    def _add_task(self, task, timeout=None):
+        self._tasks[task] = None
+        if timeout is not None:
+            task._call_later(timeout, lambda: self._remove_task(task))
+
+    def _remove_task(self, task):
+        # Called on timeout. If the event was set in the mean time, the task
+        # has already been scheduled, and is no longer in our dict.
+        if task in self._tasks:
+            del self._tasks[task]
+            task.call_step_later(0)
 
     def set(self):
         self._is_set = True
         for task in self._tasks:
             task.call_step_later(0)
-        self._tasks = []
+        self._tasks = {}
+
+
+class EventWaiter:
+    __slots__ = ["event", "timeout"]
+
+    def __init__(self, event, timeout):
+        self.event = event
+        self.timeout = timeout
+
+    def __await__(self):
+        yield self
+
+
+async def wait_for_event(event, timeout):
+    """Wait for the event to be set, or until timeout seconds have passed."""
+    if not event._is_set:
+        await EventWaiter(event, timeout)
 
 
 class CancelledError(BaseException):
@@ -63,24 +93,39 @@ class Task:
 
     def __init__(self, call_later_func, coro, name):
         self._call_later = call_later_func
-        self._done_callbacks = []
+        self._done_callbacks = None  # None, a callable, or a list of callables
         self.coro = coro
         self.name = name
         self.cancelled = False
         self.call_step_later(0)
 
     def add_done_callback(self, callback):
-        self._done_callbacks.append(callback)
+        # Most tasks have zero or one callback, so we only create a list when needed
+        callbacks = self._done_callbacks
+        if callbacks is None:
+            self._done_callbacks = callback
+        elif isinstance(callbacks, list):
+            callbacks.append(callback)
+        else:
+            self._done_callbacks = [callbacks, callback]
 
     def _close(self):
         self.loop = None
         self.coro = None
-        for callback in self._done_callbacks:
-            try:
-                callback(self)
-            except Exception:
-                pass
-        self._done_callbacks.clear()
+        callbacks, self._done_callbacks = self._done_callbacks, None
+        if callbacks is None:
+            pass
+        elif isinstance(callbacks, list):
+            for callback in callbacks:
+                self._call_done_callback(callback)
+        else:
+            self._call_done_callback(callbacks)
+
+    def _call_done_callback(self, callback):
+        try:
+            callback(self)
+        except Exception:
+            pass
 
     def call_step_later(self, delay):
         self._call_later(delay, self.step)
@@ -118,19 +163,15 @@ class Task:
         if stop:
             return self._close()
 
-        error = None
-        if not (isinstance(result, dict) and result.get("wait_method", None)):
-            error = f"Incompatible awaitable result {result!r}. Maybe you used asyncio or trio (this does not run on either)?"
+        # Dispatch on the exact type of the awaitable
+        result_type = type(result)
+        if result_type is Sleeper:
+            self.call_step_later(result.delay)
+        elif result_type is Event:
+            result._add_task(self)
+        elif result_type is EventWaiter:
+            result.event._add_task(self, result.timeout)
         else:
-            wait_method = result["wait_method"]
-            if wait_method == "sleep":
-                self.call_step_later(result["delay"])
-            elif wait_method == "event":
-                result["event"]._add_task(self)
-            else:
-                error = f"Unknown wait_method {wait_method!r}."
-
-        if error:
             logger.error(
                 f"Incompatible awaitable result {result!r}. Maybe you used asyncio or trio (this does not run on either)?"
             )
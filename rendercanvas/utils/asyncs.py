@@ -22,6 +22,28 @@ async def sleep(delay):
     await sleep(delay)
 
 
+async def wait_for_event(event, timeout):
+    """Generic wait for an event, but at most timeout seconds. Works with trio, asyncio and rendercanvas-native."""
+    libname = sniffio.current_async_library()
+    if libname == "trio":
+        with sys.modules["trio"].move_on_after(timeout):
+            await event.wait()
+    elif libname == "asyncio":
+        asyncio = sys.modules["asyncio"]
+        try:
+            if hasattr(asyncio, "timeout"):
+                # Python 3.11+, cheaper than wait_for(), which creates a task
+                async with asyncio.timeout(timeout):
+                    await event.wait()
+            else:
+                await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+    else:
+        wait_for_event = sys.modules[libname].wait_for_event
+        await wait_for_event(event, timeout)
+
+
 class Event:
     """Generic async event object. Works with trio, asyncio and rendercanvas-native."""
 
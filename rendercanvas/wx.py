@@ -165,6 +165,14 @@ class WxLoop(BaseLoop):
         # we use the async adapter with call_later
         return super()._rc_add_task(async_func, name)
 
+    def _rc_call_soon(self, callback):
+        # The native timer cannot be cancelled, so we use the default, which creates a task
+        super()._rc_call_soon(callback)
+
+    def _rc_call_later_cb(self, delay, callback):
+        # The native timer cannot be cancelled, so we use the default, which creates a task
+        super()._rc_call_later_cb(delay, callback)
+
     def _rc_call_later(self, delay, callback):
         wx.CallLater(int(delay * 1000), callback)
 
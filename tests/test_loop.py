@@ -16,6 +16,7 @@ from rendercanvas.raw import RawLoop
 from rendercanvas.utils.asyncs import sleep as async_sleep
 from testutils import run_tests
 import trio
+import sniffio
 
 import pytest
 
@@ -109,6 +110,26 @@ def test_loop_detects_canvases(SomeLoop):
     assert len(loop.get_canvases()) == 3
 
 
+@pytest.mark.parametrize("SomeLoop", [RawLoop, AsyncioLoop])
+def test_get_canvases_while_groups_change(SomeLoop):
+    # A backend may cause canvas groups to be (un)registered from get_closed()
+
+    loop = SomeLoop()
+    group1 = CanvasGroup(loop)
+    group2 = CanvasGroup(loop)
+
+    class SneakyCanvas(FakeCanvas):
+        def get_closed(self):
+            group2._register_canvas(FakeCanvas(), fake_task)
+            return False
+
+    canvas1 = SneakyCanvas()
+    group1._register_canvas(canvas1, fake_task)
+
+    assert loop.get_canvases() == [canvas1]
+    assert len(loop._BaseLoop__canvas_groups) == 2
+
+
 @pytest.mark.parametrize("SomeLoop", [RawLoop, AsyncioLoop])
 def test_run_loop_without_canvases(SomeLoop):
     # After all canvases are closed, it can take one tick before its detected.
@@ -180,6 +201,32 @@ def test_run_loop_and_close_canvases(SomeLoop):
     assert canvas2._events.is_closed
 
 
+@pytest.mark.parametrize("SomeLoop", [RawLoop, AsyncioLoop])
+def test_run_loop_and_close_canvas_created_later(SomeLoop):
+    # A canvas that is created while the loop runs also gets its close event
+
+    loop = SomeLoop()
+    group = CanvasGroup(loop)
+
+    canvas1 = FakeCanvas()
+    canvas2 = FakeCanvas()
+    group._register_canvas(canvas1, fake_task)
+
+    loop.call_later(0.1, group._register_canvas, canvas2, fake_task)
+    loop.call_later(0.2, canvas1.manually_close)
+    loop.call_later(0.3, canvas2.manually_close)
+
+    t0 = time.time()
+    loop.run()
+    et = time.time() - t0
+
+    print(et)
+    assert 0.25 < et < 0.45
+
+    assert canvas1._events.is_closed
+    assert canvas2._events.is_closed
+
+
 @pytest.mark.parametrize("SomeLoop", [RawLoop, AsyncioLoop])
 def test_run_loop_and_close_by_loop_stop(SomeLoop):
     # Close, then wait at most one tick to close canvases, and another to conform close.
@@ -205,6 +252,57 @@ def test_run_loop_and_close_by_loop_stop(SomeLoop):
     assert canvas2._events.is_closed
 
 
+@pytest.mark.parametrize("SomeLoop", [RawLoop, AsyncioLoop])
+def test_run_loop_and_close_by_loop_stop_is_fast(SomeLoop):
+    # Stopping wakes up the loop-task, so it does not have to wait for ticks.
+    loop = SomeLoop()
+    group = CanvasGroup(loop)
+
+    canvas1 = FakeCanvas()
+    group._register_canvas(canvas1, fake_task)
+
+    loop.call_later(0.25, loop.stop)
+
+    t0 = time.time()
+    loop.run()
+    et = time.time() - t0
+
+    print(et)
+    assert 0.2 < et < 0.32
+
+    assert canvas1._events.is_closed
+
+
+@pytest.mark.parametrize("SomeLoop", [RawLoop, AsyncioLoop])
+def test_run_loop_and_close_by_loop_stop_closes_async(SomeLoop):
+    # A canvas that does not close right away (e.g. via the GUI event loop)
+    # must not make the loop-task spin.
+    loop = SomeLoop()
+    group = CanvasGroup(loop)
+
+    class SlowClosingCanvas(FakeCanvas):
+        def _rc_close(self):
+            loop.call_later(0.2, self.manually_close)
+
+    canvas1 = SlowClosingCanvas()
+    group._register_canvas(canvas1, fake_task)
+
+    loop.call_later(0.1, loop.stop)
+
+    # Run in a thread, so we can detect a hang
+    t0 = time.time()
+    t = threading.Thread(target=loop.run, daemon=True)
+    t.start()
+    t.join(3)
+    et = time.time() - t0
+
+    assert not t.is_alive(), "loop hangs"
+    print(et)
+    assert 0.25 < et < 0.6
+
+    assert canvas1._events.is_closed
+
+
 @pytest.mark.parametrize("SomeLoop", [RawLoop, AsyncioLoop])
 def test_run_loop_and_close_by_loop_stop_via_async(SomeLoop):
     # Close using a coro
@@ -340,6 +438,47 @@ def test_run_loop_and_interrupt(SomeLoop):
     assert canvas2._events.is_closed
 
 
+@pytest.mark.parametrize("SomeLoop", [RawLoop, AsyncioLoop])
+def test_run_loop_and_sigterm(SomeLoop):
+    # A Python handler for SIGTERM is replaced while running, and restored afterwards
+
+    loop = SomeLoop()
+    group = CanvasGroup(loop)
+
+    canvas1 = FakeCanvas()
+    group._register_canvas(canvas1, fake_task)
+
+    def my_handler(sig, frame):
+        pass
+
+    def terminate_soon():
+        time.sleep(0.3)
+        signal.raise_signal(signal.SIGTERM)
+
+    loop.call_later(1.3, loop.stop)  # failsafe
+
+    prev_sigint_handler = signal.getsignal(signal.SIGINT)
+    prev_sigterm_handler = signal.signal(signal.SIGTERM, my_handler)
+    try:
+        t = threading.Thread(target=terminate_soon)
+        t.start()
+        t0 = time.time()
+        loop.run()
+        et = time.time() - t0
+        t.join()
+
+        # Stopped by the signal, not by the failsafe
+        print(et)
+        assert et < 0.8
+
+        assert signal.getsignal(signal.SIGINT) is prev_sigint_handler
+        assert signal.getsignal(signal.SIGTERM) is my_handler
+    finally:
+        signal.signal(signal.SIGTERM, prev_sigterm_handler)
+
+    assert canvas1._events.is_closed
+
+
 @pytest.mark.parametrize("SomeLoop", [RawLoop, AsyncioLoop])
 def test_run_loop_and_interrupt_harder(SomeLoop):
     # In the next tick after the second interupt, it stops the loop without closing the canvases
@@ -376,6 +515,56 @@ def test_run_loop_and_interrupt_harder(SomeLoop):
     assert not canvas2._events.is_closed
 
 
+@pytest.mark.parametrize("SomeLoop", [RawLoop, AsyncioLoop])
+def test_run_loop_and_stop_forced(SomeLoop):
+    # A forced stop stops the loop right away, without closing the canvases
+
+    loop = SomeLoop()
+    group = CanvasGroup(loop)
+
+    canvas1 = FakeCanvas(refuse_close=True)
+    canvas2 = FakeCanvas(refuse_close=True)
+    group._register_canvas(canvas1, fake_task)
+    group._register_canvas(canvas2, fake_task)
+
+    loop.call_later(0.3, lambda: loop.stop(force=True))
+
+    t0 = time.time()
+    loop.run()
+    et = time.time() - t0
+
+    print(et)
+    assert 0.25 < et < 0.4
+
+    assert not canvas1._events.is_closed
+    assert not canvas2._events.is_closed
+
+
+@pytest.mark.parametrize("SomeLoop", [RawLoop, AsyncioLoop])
+def test_run_loop_and_stop_forced_when_idle(SomeLoop):
+    # A forced stop on a loop that is not running does nothing
+
+    loop = SomeLoop()
+    loop.stop(force=True)
+
+    group = CanvasGroup(loop)
+    canvas1 = FakeCanvas()
+    group._register_canvas(canvas1, fake_task)
+    loop.stop(force=True)
+
+    # The loop still runs normally
+    loop.call_later(0.3, loop.stop)
+
+    t0 = time.time()
+    loop.run()
+    et = time.time() - t0
+
+    print(et)
+    assert 0.25 < et < 0.4
+
+    assert canvas1._events.is_closed
+
+
 @pytest.mark.parametrize("SomeLoop", [RawLoop, AsyncioLoop])
 def test_loop_threaded(SomeLoop):
     t = threading.Thread(target=test_run_loop_and_close_by_loop_stop, args=(SomeLoop,))
@@ -383,6 +572,138 @@ def test_loop_threaded(SomeLoop):
     t.join()
 
 
+@pytest.mark.parametrize("SomeLoop", [RawLoop, AsyncioLoop])
+def test_call_soon_coalesce(SomeLoop):
+    loop = SomeLoop()
+    group = CanvasGroup(loop)
+    canvas1 = FakeCanvas()
+    group._register_canvas(canvas1, fake_task)
+
+    called = []
+
+    def schedule():
+        for i in range(3):
+            loop.call_soon(called.append, ("a", i), coalesce_key="a")
+            loop.call_soon(called.append, ("b", i), coalesce_key="b")
+            loop.call_soon(called.append, ("c", i))
+
+    def schedule_again():
+        loop.call_soon(called.append, ("a", 9), coalesce_key="a")
+
+    loop.call_later(0.1, schedule)
+    loop.call_later(0.2, schedule_again)
+    loop.call_later(0.3, canvas1.manually_close)
+    loop.run()
+
+    assert sorted(called) == [
+        ("a", 2),
+        ("a", 9),
+        ("b", 2),
+        ("c", 0),
+        ("c", 1),
+        ("c", 2),
+    ]
+
+
+def test_call_soon_coalesce_schedule_error():
+    # When scheduling fails, the key must not block later calls
+
+    class FailingLoop(RawLoop):
+        fail = True
+
+        def _rc_call_soon(self, callback):
+            if self.fail:
+                raise RuntimeError("cannot schedule")
+            super()._rc_call_soon(callback)
+
+    loop = FailingLoop()
+    group = CanvasGroup(loop)
+    canvas1 = FakeCanvas()
+    group._register_canvas(canvas1, fake_task)
+
+    called = []
+
+    with pytest.raises(RuntimeError):
+        loop.call_soon(called.append, 1, coalesce_key="a")
+
+    loop.fail = False
+    loop.call_soon(called.append, 2, coalesce_key="a")
+    loop.call_later(0.1, canvas1.manually_close)
+    loop.run()
+
+    assert called == [2]
+
+
+def test_asyncio_call_later_cancelled_on_stop():
+    # The asyncio loop uses native timers for call_later, these must be cancelled on stop
+
+    loop = AsyncioLoop()
+    group = CanvasGroup(loop)
+    canvas1 = FakeCanvas()
+    group._register_canvas(canvas1, fake_task)
+
+    called = []
+
+    async def starter():
+        loop.call_later(0.1, called.append, "early")
+        loop.call_later(0.5, called.append, "late")
+        loop.call_later(0.2, loop.stop)
+
+    loop.add_task(starter)
+
+    async def main():
+        await loop.run_async()
+        await asyncio.sleep(0.5)
+
+    asyncio.run(main())
+
+    assert called == ["early"]
+
+
+def test_asyncio_call_soon_cancelled_on_stop():
+    # The asyncio loop uses the native call_soon, these must be cancelled on stop
+
+    loop = AsyncioLoop()
+    group = CanvasGroup(loop)
+    canvas1 = FakeCanvas()
+    group._register_canvas(canvas1, fake_task)
+
+    called = []
+
+    def stopper():
+        loop.call_soon(called.append, "soon")
+        loop.stop(force=True)
+
+    loop.call_later(0.1, stopper)
+    loop.run()
+
+    assert called == []
+
+
+def test_asyncio_callbacks_detect_asyncio():
+    # Callbacks run via the native loop, but sniffio must still detect asyncio
+
+    loop = AsyncioLoop()
+    group = CanvasGroup(loop)
+    canvas1 = FakeCanvas()
+    group._register_canvas(canvas1, fake_task)
+
+    libnames = []
+
+    def callback():
+        libnames.append(sniffio.current_async_library())
+
+    async def starter():
+        loop.call_soon(callback)
+        loop.call_later(0.1, callback)
+
+    loop.add_task(starter)
+    loop.call_later(0.2, loop.stop)
+    loop.run()
+
+    assert libnames == ["asyncio", "asyncio"]
+
+
 def test_async_loops_check_lib():
     # Cannot run asyncio loop on trio
 
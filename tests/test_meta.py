@@ -75,7 +75,16 @@ def test_namespace():
 
 @pytest.mark.skipif(sys.version_info < (3, 10), reason="Need py310+")
 def test_deps_plain_import():
+    # The public classes are imported lazily
     modules = get_loaded_modules("rendercanvas", 1)
+    assert modules == {"rendercanvas"}
+
+    modules = get_loaded_modules("rendercanvas; rendercanvas.BaseRenderCanvas", 1)
+    assert modules == {"rendercanvas", "sniffio"}
+
+    # Submodules are available as attributes, as they were before the lazy import
+    code = "rendercanvas; rendercanvas.utils.asyncs.sleep; rendercanvas.base.BaseLoop"
+    modules = get_loaded_modules(code, 1)
     assert modules == {"rendercanvas", "sniffio"}
 
 
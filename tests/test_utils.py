@@ -1,6 +1,10 @@
 import gc
+import time
+import asyncio
 
+import trio
 import rendercanvas
+from rendercanvas.utils.asyncs import wait_for_event, Event
 from testutils import run_tests, is_pypy
 
 
@@ -38,5 +42,52 @@ def test_weakbind():
     assert len(xx) == 3  # f2 is gone!
 
 
+def test_log_exception_reuse(caplog):
+    log_exception = rendercanvas._coreutils.log_exception
+
+    logger = log_exception("Reused logger:")
+
+    for i in range(3):
+        with logger:
+            raise ValueError("reused-logger-error")
+        with logger:
+            pass
+
+    # Other exceptions are not swallowed
+    try:
+        with logger:
+            raise KeyboardInterrupt()
+    except KeyboardInterrupt:
+        pass
+    else:
+        raise AssertionError("Should have raised KeyboardInterrupt")
+
+    text = caplog.text
+    assert text.count("Reused logger:") == 3
+    assert text.count("reused-logger-error") == 4  # one traceback => 2 mentions
+    assert text.count("(3)") == 1
+
+
+def test_wait_for_event():
+    async def main():
+        event = Event()
+
+        # Times out
+        t0 = time.perf_counter()
+        await wait_for_event(event, 0.1)
+        et = time.perf_counter() - t0
+        assert 0.08 < et < 0.3
+
+        # Returns right away when set
+        event.set()
+        t0 = time.perf_counter()
+        await wait_for_event(event, 1.0)
+        et = time.perf_counter() - t0
+        assert et < 0.1
+
+    asyncio.run(main())
+    trio.run(main)
+
+
 if __name__ == "__main__":
     run_tests(globals())